@@ -6,41 +6,259 @@ A unified utility for managing ArcGIS connections with robust certificate handli
 performance monitoring, and enterprise-grade logging.
 """
 
-import ssl
-import socket
+import importlib
+import contextvars
+import hashlib
+import hmac
+import atexit
+import queue
+import random
+import re
 import os
 import logging
+import logging.handlers
 import time
 import sys
 import getpass
-from typing import Optional, Any
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from dataclasses import dataclass, asdict
+from typing import Optional, Any, Iterable, Mapping, Union, TYPE_CHECKING
 from pathlib import Path
-from functools import wraps
+from functools import wraps, partial
 from datetime import datetime
+from urllib.parse import urlsplit
 
-import requests
-import certifi
+if TYPE_CHECKING:
+    import requests
 
-# Optional Windows Credential Manager support
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
+# Heavy third-party dependencies (requests, certifi, keyring, arcgis) are imported
+# lazily on first use so short-lived scripts only pay for what they touch.
+_lazy_modules: dict[str, Any] = {}
+
+
+def _lazy_import(name: str, optional: bool = False) -> Any:
+    """
+    Import a module once, on first use, and cache it.
+    
+    No lock is held here: the import system already serialises imports of the
+    same module, so concurrent first calls simply get the same module object
+    while imports of unrelated modules proceed in parallel.
+    
+    Args:
+        name: Fully qualified module name
+        optional: Return None instead of raising if the module is not installed
+    """
+    try:
+        return _lazy_modules[name]
+    except KeyError:
+        pass
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        if not optional:
+            raise
+        module = None
+    _lazy_modules[name] = module
+    return module
+
+
+def _requests() -> Any:
+    return _lazy_import("requests")
+
+
+def _certifi() -> Any:
+    return _lazy_import("certifi")
+
+
+def _keyring() -> Any:
+    """Optional Windows Credential Manager support; None if keyring is not installed."""
+    return _lazy_import("keyring", optional=True)
+
+
+def _gis_class() -> Any:
+    return _lazy_import("arcgis.gis").GIS
+
+
+def keyring_available() -> bool:
+    """Check whether the optional keyring package can be used."""
+    return _keyring() is not None
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatibility for the former eager module-level names
+    if name == "KEYRING_AVAILABLE":
+        return keyring_available()
+    if name == "keyring":
+        return _keyring()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warm_up_imports(background: bool = True, include_arcgis: bool = True) -> Optional[threading.Thread]:
+    """
+    Pre-load heavy dependencies so the first connection does not pay for them.
+    
+    Args:
+        background: Import on a daemon thread and return immediately
+        include_arcgis: Also import ``arcgis.gis``, by far the slowest import
+        
+    Returns:
+        The warm-up thread when running in the background, otherwise None
+    """
+    names = ["requests", "certifi", "keyring"] + (["arcgis.gis"] if include_arcgis else [])
+    
+    def warm():
+        for name in names:
+            try:
+                _lazy_import(name, optional=True)
+            except Exception:
+                pass
+    
+    if not background:
+        warm()
+        return None
+    thread = threading.Thread(target=warm, name="arcgis_utils_warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that applies an overflow policy when the buffer is full."""
+    
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop_new"):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        
+        if self.overflow == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
+        self.dropped += 1
+
+
+class _BatchingQueueListener:
+    """Background writer that drains log records in batches and flushes once per batch."""
+    
+    _SENTINEL = None
+    
+    def __init__(self, log_queue: queue.Queue, handlers: list, batch_size: int = 100,
+                 flush_interval: float = 0.5):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = threading.Thread(target=self._run, name="simple_logger_writer", daemon=True)
+        self._thread.start()
+    
+    @staticmethod
+    def _can_batch(handler: logging.Handler) -> bool:
+        """Plain stream/file handlers with an open stream can be written in one locked batch."""
+        return (isinstance(handler, logging.StreamHandler)
+                and type(handler).emit in (logging.StreamHandler.emit, logging.FileHandler.emit)
+                and handler.stream is not None)
+    
+    def _write_batch(self, batch: list) -> None:
+        for handler in self.handlers:
+            if not self._can_batch(handler):
+                # Rotating, SMTP, HTTP, syslog and other handlers keep their own emit logic
+                for record in batch:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+                continue
+            
+            handler.acquire()
+            try:
+                for record in batch:
+                    if record.levelno < handler.level or not handler.filter(record):
+                        continue
+                    try:
+                        handler.stream.write(handler.format(record) + handler.terminator)
+                    except Exception:
+                        handler.handleError(record)
+                handler.flush()
+            finally:
+                handler.release()
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            while True:
+                if record is self._SENTINEL:
+                    stopping = True
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+    
+    def stop(self) -> None:
+        """Write out all queued records, then stop the writer thread and close handlers."""
+        if self._thread.is_alive():
+            self.queue.put(self._SENTINEL)
+            self._thread.join()
+        for handler in self.handlers:
+            handler.close()
 
 
 class SimpleLogger:
     """
     A simple, focused logger for ArcGIS operations.
     Provides both console and file logging with timing information.
+    
+    With ``use_queue=True`` log calls only enqueue records; a background thread
+    writes them in batches so slow consoles or network-share log files never
+    block the caller. Messages accept %-style arguments that are only formatted
+    when the level is enabled.
     """
     
-    def __init__(self, name: str = "arcgis_utils", log_file: Optional[str] = None, level: str = "INFO"):
+    _listeners: dict[str, _BatchingQueueListener] = {}
+    
+    def __init__(self, name: str = "arcgis_utils", log_file: Optional[str] = None, level: str = "INFO",
+                 use_queue: bool = False, queue_size: int = 10000, overflow: str = "drop_new",
+                 batch_size: int = 100, flush_interval: float = 0.5):
+        if overflow not in ("drop_new", "drop_oldest", "block"):
+            raise ValueError("Overflow must be 'drop_new', 'drop_oldest' or 'block'")
+        
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, level.upper()))
+        self._queue_handler: Optional[_BoundedQueueHandler] = None
         
-        # Clear any existing handlers
+        # Clear any existing handlers, stopping a previous background writer for this name
         self.logger.handlers.clear()
+        previous = SimpleLogger._listeners.pop(name, None)
+        if previous:
+            previous.stop()
         
         # Create formatter with timestamp
         formatter = logging.Formatter(
@@ -51,38 +269,237 @@ class SimpleLogger:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # File handler (optional)
+        file_error = None
         if log_file:
             try:
                 file_handler = logging.FileHandler(log_file)
                 file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except Exception as e:
-                self.logger.warning(f"Could not create file handler: {e}")
+                file_error = e
+        
+        if use_queue:
+            log_queue = queue.Queue(maxsize=queue_size)
+            self._queue_handler = _BoundedQueueHandler(log_queue, overflow)
+            self.logger.addHandler(self._queue_handler)
+            SimpleLogger._listeners[name] = _BatchingQueueListener(log_queue, handlers, batch_size, flush_interval)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+        
+        if file_error:
+            self.logger.warning(f"Could not create file handler: {file_error}")
+    
+    @property
+    def dropped_records(self) -> int:
+        """Number of records discarded because the queue was full."""
+        return self._queue_handler.dropped if self._queue_handler else 0
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether messages at ``level`` would be emitted."""
+        return self.logger.isEnabledFor(getattr(logging, level.upper()))
+    
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
     
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def error(self, message: str, *args):
+        self.logger.error(message, *args)
     
-    def error(self, message: str):
-        self.logger.error(message)
+    def critical(self, message: str, *args):
+        self.logger.critical(message, *args)
+    
+    def close(self) -> None:
+        """Drain queued records and stop the background writer (no-op without a queue)."""
+        listener = SimpleLogger._listeners.pop(self.logger.name, None)
+        if listener:
+            self.logger.removeHandler(self._queue_handler)
+            listener.stop()
+    
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Drain and stop every background writer; registered to run at interpreter exit."""
+        for name in list(cls._listeners):
+            cls._listeners.pop(name).stop()
+
+
+atexit.register(SimpleLogger.shutdown_all)
+
+
+class MetricsRegistry:
+    """
+    In-process timing metrics for instrumented functions.
+    
+    Records per-function call counts, error counts and duration samples (from
+    which p50/p95/p99 are computed), plus aggregate timings for each nested span
+    path such as ``connect_to_portal > get_verified_certificate``. Recording is a
+    no-op while the registry is disabled.
+    """
+    
+    QUANTILES = (0.5, 0.95, 0.99)
+    
+    def __init__(self, enabled: bool = False, max_samples: int = 10000):
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self._functions: dict[str, dict] = {}
+        self._spans: dict[str, dict] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, name: str, duration: float, error: bool = False, span: Optional[str] = None) -> None:
+        """Record one call of ``name`` taking ``duration`` seconds."""
+        with self._lock:
+            stats = self._functions.get(name)
+            if stats is None:
+                stats = self._functions[name] = {"count": 0, "errors": 0, "sum": 0.0, "max": 0.0, "samples": []}
+            stats["count"] += 1
+            stats["sum"] += duration
+            stats["max"] = max(stats["max"], duration)
+            if error:
+                stats["errors"] += 1
+            
+            # Reservoir sampling keeps an unbiased, bounded sample for quantiles
+            samples = stats["samples"]
+            if len(samples) < self.max_samples:
+                samples.append(duration)
+            else:
+                slot = random.randrange(stats["count"])
+                if slot < self.max_samples:
+                    samples[slot] = duration
+            
+            if span:
+                span_stats = self._spans.setdefault(span, {"count": 0, "errors": 0, "sum": 0.0})
+                span_stats["count"] += 1
+                span_stats["sum"] += duration
+                if error:
+                    span_stats["errors"] += 1
+    
+    @classmethod
+    def _quantile(cls, ordered: list, q: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    
+    def summary(self) -> dict:
+        """Return per-function and per-span statistics."""
+        with self._lock:
+            functions = {}
+            for name, stats in self._functions.items():
+                ordered = sorted(stats["samples"])
+                functions[name] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "sum": stats["sum"],
+                    "mean": stats["sum"] / stats["count"],
+                    "max": stats["max"],
+                    **{f"p{int(q * 100)}": self._quantile(ordered, q) for q in self.QUANTILES}
+                }
+            spans = {path: dict(stats) for path, stats in self._spans.items()}
+        return {"functions": functions, "spans": spans}
+    
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._functions.clear()
+            self._spans.clear()
+    
+    def to_prometheus(self, prefix: str = "arcgis_utils") -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        def label(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"')
+        
+        summary = self.summary()
+        lines = [
+            f"# HELP {prefix}_function_duration_seconds Duration of instrumented functions.",
+            f"# TYPE {prefix}_function_duration_seconds summary"
+        ]
+        for name, stats in summary["functions"].items():
+            for q in self.QUANTILES:
+                lines.append(f'{prefix}_function_duration_seconds{{function="{label(name)}",quantile="{q}"}} '
+                             f'{stats[f"p{int(q * 100)}"]:.6f}')
+            lines.append(f'{prefix}_function_duration_seconds_sum{{function="{label(name)}"}} {stats["sum"]:.6f}')
+            lines.append(f'{prefix}_function_duration_seconds_count{{function="{label(name)}"}} {stats["count"]}')
+        
+        lines += [f"# HELP {prefix}_function_errors_total Failed calls of instrumented functions.",
+                  f"# TYPE {prefix}_function_errors_total counter"]
+        for name, stats in summary["functions"].items():
+            lines.append(f'{prefix}_function_errors_total{{function="{label(name)}"}} {stats["errors"]}')
+        
+        lines += [f"# HELP {prefix}_span_duration_seconds Duration of nested call paths.",
+                  f"# TYPE {prefix}_span_duration_seconds summary"]
+        for path, stats in summary["spans"].items():
+            lines.append(f'{prefix}_span_duration_seconds_sum{{span="{label(path)}"}} {stats["sum"]:.6f}')
+            lines.append(f'{prefix}_span_duration_seconds_count{{span="{label(path)}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+    
+    def export(self, path: str, format: str = "json") -> None:
+        """
+        Write metrics to a file.
+        
+        Args:
+            path: Output file path
+            format: ``json`` or ``prometheus``
+        """
+        if format == "json":
+            content = json.dumps(self.summary(), indent=2)
+        elif format == "prometheus":
+            content = self.to_prometheus()
+        else:
+            raise ValueError("Format must be 'json' or 'prometheus'")
+        
+        # Per-process and per-thread temp name so concurrent exports cannot clobber each other
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+
+# Process-wide registry used by the instrumentation decorators
+metrics = MetricsRegistry(enabled=os.environ.get("ARCGIS_UTILS_METRICS", "").lower() in ("1", "true", "yes"))
+
+# Path of instrumented calls currently executing in this context
+_current_span: contextvars.ContextVar[tuple] = contextvars.ContextVar("arcgis_utils_span", default=())
+
+
+def _call_instrumented(func, func_name: str, args: tuple, kwargs: dict) -> Any:
+    """Run ``func`` inside a span and record its duration in the metrics registry."""
+    path = _current_span.get() + (func_name,)
+    token = _current_span.set(path)
+    start_time = time.perf_counter()
+    error = False
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        error = True
+        raise
+    finally:
+        _current_span.reset(token)
+        metrics.record(func_name, time.perf_counter() - start_time, error, " > ".join(path))
+
+
+def traced(func):
+    """Decorator recording metrics and span nesting for a function without logging."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not metrics.enabled:
+            return func(*args, **kwargs)
+        return _call_instrumented(func, func.__name__, args, kwargs)
     
-    def critical(self, message: str):
-        self.logger.critical(message)
+    return wrapper
 
 
 def timed_function(func):
     """Decorator to time function execution with detailed logging."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         func_name = func.__name__
         
         # Get logger from first argument if it's a class instance
@@ -94,9 +511,11 @@ def timed_function(func):
             logger.info(f"Starting {func_name}...")
         
         try:
-            result = func(*args, **kwargs)
-            end_time = time.time()
-            duration = end_time - start_time
+            if metrics.enabled:
+                result = _call_instrumented(func, func_name, args, kwargs)
+            else:
+                result = func(*args, **kwargs)
+            duration = time.perf_counter() - start_time
             
             if logger:
                 logger.info(f"Completed {func_name} in {duration:.2f} seconds")
@@ -105,8 +524,7 @@ def timed_function(func):
             
             return result
         except Exception as e:
-            end_time = time.time()
-            duration = end_time - start_time
+            duration = time.perf_counter() - start_time
             
             if logger:
                 logger.error(f"Failed {func_name} after {duration:.2f} seconds: {str(e)}")
@@ -121,26 +539,106 @@ class SecureCredentialManager:
     """
     Manages secure credential storage and retrieval using secure methods.
     Supports keyring (Windows Credential Manager) and secure prompts.
+    
+    When ``cache_ttl`` is set, retrieved passwords are kept in a process-local
+    cache keyed by (service_name, username) so repeated connections cost a single
+    keyring round trip. Cached secrets are held in mutable buffers that are
+    zeroed when they expire or are invalidated.
     """
     
-    def __init__(self, logger: Optional['SimpleLogger'] = None):
+    def __init__(self, logger: Optional['SimpleLogger'] = None, cache_ttl: Optional[float] = None):
         self.logger = logger or SimpleLogger("credential_manager")
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple[str, str], tuple[bytearray, float]] = {}
+        self._cache_lock = threading.Lock()
+        # Weak values: a lookup lock lives only while some caller is using it
+        self._lookup_locks: weakref.WeakValueDictionary[tuple[str, str], threading.Lock] = \
+            weakref.WeakValueDictionary()
+    
+    @staticmethod
+    def _zero(secret: bytearray) -> None:
+        """Overwrite a cached secret in place."""
+        secret[:] = bytes(len(secret))
+    
+    def _evict_expired(self, now: float) -> None:
+        """Zero and drop expired entries. Caller holds the cache lock."""
+        for key in [k for k, (_, expires) in self._cache.items() if expires <= now]:
+            secret, _ = self._cache.pop(key)
+            self._zero(secret)
+    
+    def _cached_password(self, key: tuple[str, str]) -> Optional[str]:
+        with self._cache_lock:
+            self._evict_expired(time.monotonic())
+            entry = self._cache.get(key)
+            return entry[0].decode("utf-8") if entry else None
+    
+    def _cache_password(self, key: tuple[str, str], password: str) -> None:
+        with self._cache_lock:
+            previous = self._cache.pop(key, None)
+            if previous:
+                self._zero(previous[0])
+            self._cache[key] = (bytearray(password.encode("utf-8")), time.monotonic() + self.cache_ttl)
     
-    def get_credential(self, username: Optional[str] = None, service_name: str = "ArcGIS") -> tuple[Optional[str], Optional[str]]:
+    def invalidate(self, username: Optional[str] = None, service_name: Optional[str] = None) -> None:
+        """
+        Remove cached credentials, e.g. after an authentication failure.
+        
+        Args:
+            username: Only invalidate entries for this username (all users if None)
+            service_name: Only invalidate entries for this service (all services if None)
+        """
+        with self._cache_lock:
+            for key in [k for k in self._cache
+                        if (service_name is None or k[0] == service_name)
+                        and (username is None or k[1] == username)]:
+                secret, _ = self._cache.pop(key)
+                self._zero(secret)
+                self.logger.info(f"Invalidated cached credentials for user: {key[1]}")
+    
+    @traced
+    def get_credential(self, username: Optional[str] = None, service_name: str = "ArcGIS",
+                       allow_prompt: bool = True) -> tuple[Optional[str], Optional[str]]:
         """
         Get credentials using secure methods in order of preference:
-        1. Windows Credential Manager (keyring) - recommended
-        2. Secure prompt (getpass)
+        1. In-process cache (only when ``cache_ttl`` is set)
+        2. Windows Credential Manager (keyring) - recommended
+        3. Secure prompt (getpass)
         
         Args:
             username: Optional username to retrieve password for
             service_name: Service name for credential storage
+            allow_prompt: Whether to fall back to an interactive prompt (disable for unattended runs)
             
         Returns:
             tuple: (username, password) or (None, None) if not found
         """
+        if not (self.cache_ttl and username):
+            return self._retrieve_credential(username, service_name, allow_prompt)
+        
+        key = (service_name, username)
+        with self._cache_lock:
+            lookup_lock = self._lookup_locks.get(key)
+            if lookup_lock is None:
+                lookup_lock = self._lookup_locks[key] = threading.Lock()
+        
+        # Concurrent callers for the same account wait for a single lookup
+        with lookup_lock:
+            cached = self._cached_password(key)
+            if cached is not None:
+                self.logger.debug("Using cached credentials for user: %s", username)
+                return username, cached
+            
+            found_username, password = self._retrieve_credential(username, service_name, allow_prompt)
+            if password:
+                self._cache_password(key, password)
+            return found_username, password
+    
+    def _retrieve_credential(self, username: Optional[str], service_name: str,
+                             allow_prompt: bool) -> tuple[Optional[str], Optional[str]]:
+        """Look up credentials from keyring, falling back to a secure prompt."""
         # Method 1: Windows Credential Manager via keyring (recommended)
-        if KEYRING_AVAILABLE and username:
+        keyring = _keyring() if username else None
+        if keyring and username:
             try:
                 stored_password = keyring.get_password(service_name, username)
                 if stored_password:
@@ -150,7 +648,7 @@ class SecureCredentialManager:
                 self.logger.warning(f"Failed to retrieve from keyring: {str(e)}")
         
         # Method 2: Secure prompt
-        if username:
+        if username and allow_prompt:
             self.logger.info("Prompting for password (secure input)")
             try:
                 password = getpass.getpass(f"Enter password for {username}: ")
@@ -160,49 +658,297 @@ class SecureCredentialManager:
                 return None, None
         
         return None, None
+
+
+class HTTPSessionPool:
+    """
+    Keep-alive HTTP sessions shared across certificate probes and connection checks.
+    
+    One ``requests.Session`` is kept per portal host so repeated probes reuse the
+    underlying TCP/TLS connections. The number of hosts is bounded; the least
+    recently used session is closed when the limit is reached.
+    """
+    
+    def __init__(self, max_hosts: int = 32, max_connections_per_host: int = 4,
+                 retries: int = 2, backoff_factor: float = 0.5,
+                 status_forcelist: tuple = (502, 503, 504),
+                 logger: Optional[SimpleLogger] = None):
+        self.max_hosts = max_hosts
+        self.max_connections_per_host = max_connections_per_host
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self.logger = logger or SimpleLogger("session_pool")
+        self._sessions: OrderedDict[str, 'requests.Session'] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _pool_key(url: str) -> str:
+        """Key sessions by scheme and host so each portal gets its own pool."""
+        parsed = urlsplit(url if "://" in url else f"https://{url}")
+        return f"{parsed.scheme}://{parsed.netloc}"
     
+    def _create_session(self) -> 'requests.Session':
+        """Create a session with bounded connection pools and retry/backoff."""
+        requests = _requests()
+        retry = _lazy_import("urllib3.util.retry").Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+            # Return the last response once status retries run out: a busy portal
+            # answering 503 has still completed the TLS handshake
+            raise_on_status=False
+        )
+        adapter = _lazy_import("requests.adapters").HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_connections_per_host,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def get_session(self, url: str) -> 'requests.Session':
+        """
+        Return the pooled session for the host of ``url``, creating it if needed.
+        
+        Args:
+            url: Any URL on the target host
+            
+        Returns:
+            requests.Session: Session whose connections are reused across calls
+        """
+        key = self._pool_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                self.hits += 1
+                return session
+            
+            self.misses += 1
+            session = self._create_session()
+            self._sessions[key] = session
+            
+            while len(self._sessions) > self.max_hosts:
+                evicted_key, evicted = self._sessions.popitem(last=False)
+                evicted.close()
+                self.evictions += 1
+                self.logger.debug("Evicted HTTP session for %s", evicted_key)
+            
+            return session
+    
+    def get(self, url: str, **kwargs) -> 'requests.Response':
+        """Issue a GET request through the pooled session for the URL's host."""
+        return self.get_session(url).get(url, **kwargs)
+    
+    def stats(self) -> dict:
+        """Return pool counters for monitoring session reuse."""
+        with self._lock:
+            return {
+                "hosts": len(self._sessions),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+    
+    def close(self) -> None:
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
 
 
 class ArcGISCertificateManager:
-    """Handles SSL certificate verification for ArcGIS portals."""
+    """
+    Handles SSL certificate verification for ArcGIS portals.
     
-    def __init__(self, output_dir: str = "./certificates", logger: Optional[SimpleLogger] = None):
+    Successful verifications are cached per domain, both in-process and on disk
+    under ``output_dir/certificates``, so repeated connections to the same portal
+    can skip the network probe until the entry expires or is invalidated.
+    """
+    
+    CACHE_FILE_NAME = "verification_cache.json"
+    
+    def __init__(self, output_dir: str = "./certificates", logger: Optional[SimpleLogger] = None,
+                 cache_ttl: float = 86400, use_cache: bool = True,
+                 session_pool: Optional[HTTPSessionPool] = None):
         self.output_dir = Path(output_dir)
         self.logger = logger or SimpleLogger("cert_manager")
+        self.session_pool = session_pool or HTTPSessionPool(logger=self.logger)
+        self.cache_ttl = cache_ttl
+        self.use_cache = use_cache
+        self._cache: dict[str, dict] = {}
+        self._cache_loaded = False
+        self._cache_lock = threading.RLock()
+    
+    @property
+    def cache_file(self) -> Path:
+        """Location of the on-disk verification cache."""
+        return self.output_dir / "certificates" / self.CACHE_FILE_NAME
+    
+    @staticmethod
+    def _extract_domain(url: str) -> str:
+        """Extract the host portion of a portal URL."""
+        return url.replace("https://", "").replace("http://", "").split('/')[0]
+    
+    def _load_cache(self) -> None:
+        """Load the on-disk cache into memory once per instance."""
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
+        try:
+            with open(self.cache_file, 'r') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._cache.update(entries)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not read certificate cache: {str(e)}")
+    
+    def _save_cache(self) -> None:
+        """Persist the in-memory cache, replacing the file atomically."""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Writers in this process hold the cache lock; the pid keeps other processes'
+            # temp files apart so none is replaced half-written
+            temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w') as f:
+                json.dump(self._cache, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            self.logger.warning(f"Could not write certificate cache: {str(e)}")
+    
+    def _get_cached_certificate(self, domain: str) -> Optional[str]:
+        """
+        Return the cached bundle path for a domain if the entry is still valid.
+        
+        Entries are discarded when expired, when certifi has been upgraded since
+        the verification, or when the bundle file no longer exists.
+        """
+        with self._cache_lock:
+            self._load_cache()
+            entry = self._cache.get(domain)
+            if not entry:
+                return None
+            
+            reason = None
+            if entry.get("expires_at", 0) <= time.time():
+                reason = "expired"
+            elif entry.get("certifi_version") != _certifi().__version__:
+                reason = "certifi version changed"
+            elif not os.path.exists(entry.get("bundle_path", "")):
+                reason = "certificate bundle missing"
+            
+            if reason:
+                self.logger.debug("Discarding cached verification for %s: %s", domain, reason)
+                del self._cache[domain]
+                self._save_cache()
+                return None
+            
+            return entry["bundle_path"]
+    
+    def _store_cached_certificate(self, domain: str, bundle_path: str) -> None:
+        """Record a successful verification for a domain."""
+        now = time.time()
+        with self._cache_lock:
+            self._load_cache()
+            self._cache[domain] = {
+                "bundle_path": bundle_path,
+                "certifi_version": _certifi().__version__,
+                "verified_at": now,
+                "expires_at": now + self.cache_ttl
+            }
+            self._save_cache()
+    
+    def invalidate_cache(self, url: Optional[str] = None) -> None:
+        """
+        Invalidate cached verifications.
         
+        Args:
+            url: Portal URL whose entry should be removed; clears all entries if None
+        """
+        with self._cache_lock:
+            self._load_cache()
+            if url is None:
+                self._cache.clear()
+            else:
+                domain = self._extract_domain(url)
+                if self._cache.pop(domain, None) is None:
+                    return
+                self.logger.info(f"Invalidated cached certificate verification for {domain}")
+            self._save_cache()
+    
+    def cached_certificate(self, url: str) -> Optional[str]:
+        """Return the bundle path of a still-valid cached verification for a URL, if any."""
+        domain = self._extract_domain(url)
+        cached_path = self._get_cached_certificate(domain)
+        if cached_path:
+            self.logger.info(f"Using cached certificate verification for {domain}")
+        return cached_path
+    
+    def record_verification(self, url: str, bundle_path: str, use_cache: bool = True) -> str:
+        """Log a successful verification and cache it when caching is enabled."""
+        self.logger.info("Certificate verification successful")
+        if use_cache:
+            self._store_cached_certificate(self._extract_domain(url), bundle_path)
+        return bundle_path
+    
+    def record_failure(self, url: str, error: Exception) -> None:
+        """Log a failed SSL verification and drop any cached entry for the URL."""
+        self.logger.error(f"Certificate verification failed: {str(error)}")
+        self.invalidate_cache(url)
+    
     @timed_function
-    def get_verified_certificate(self, url: str) -> Optional[str]:
+    def get_verified_certificate(self, url: str, use_cache: Optional[bool] = None,
+                                 timeout: float = 10) -> Optional[str]:
         """
         Get certificate verification using standard Python certificate handling.
         
         Args:
             url: The portal URL to verify certificates for
+            use_cache: Override the instance cache setting for this call
+            timeout: Probe timeout in seconds
             
         Returns:
             Optional[str]: Path to certificate bundle if successful, None if verification fails
         """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        
         try:
             # Extract domain from URL
-            domain = url.replace("https://", "").replace("http://", "").split('/')[0]
-            self.logger.debug(f"Getting certificates for: {domain}")
+            domain = self._extract_domain(url)
+            self.logger.debug("Getting certificates for: %s", domain)
             
             # Set up certificate store path
             cert_store_path = self.output_dir / "certificates"
             cert_store_path.mkdir(parents=True, exist_ok=True)
             
+            if use_cache:
+                cached_path = self.cached_certificate(url)
+                if cached_path:
+                    return cached_path
+            
             # Try verification with certifi's certificates
             try:
-                certifi_path = certifi.where()
-                self.logger.debug(f"Certifi file exists: {os.path.exists(certifi_path)}")
+                certifi_path = _certifi().where()
+                if self.logger.is_enabled_for("DEBUG"):
+                    self.logger.debug("Certifi file exists: %s", os.path.exists(certifi_path))
                 
-                response = requests.get(f"https://{domain}", 
-                                    verify=certifi_path, 
-                                    timeout=10)
-                self.logger.info("Certificate verification successful")
-                return certifi_path
+                response = self.session_pool.get(f"https://{domain}", 
+                                                 verify=certifi_path, 
+                                                 timeout=timeout)
+                return self.record_verification(url, certifi_path, use_cache)
                 
-            except requests.exceptions.SSLError as ssl_err:
-                self.logger.error(f"Certificate verification failed: {str(ssl_err)}")
+            except _requests().exceptions.SSLError as ssl_err:
+                self.record_failure(url, ssl_err)
                 return None
                 
         except Exception as e:
@@ -210,6 +956,122 @@ class ArcGISCertificateManager:
             return None
 
 
+class GISConnectionPool:
+    """
+    Registry of live, validated GIS connections keyed by connection parameters.
+    
+    Connections are reused across ``connect_to_portal`` calls, re-validated when
+    their health check is due, evicted after sitting idle, and bounded in number
+    with least-recently-used eviction. Concurrent requests for the same key wait
+    for a single connection attempt instead of each building their own.
+    """
+    
+    def __init__(self, max_size: int = 16, idle_timeout: float = 1800,
+                 health_check_interval: float = 300,
+                 logger: Optional[SimpleLogger] = None):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.logger = logger or SimpleLogger("gis_connection_pool")
+        self._entries: OrderedDict[tuple, dict] = OrderedDict()
+        # Weak values: a key's lock lives only while some caller is using it
+        self._key_locks: weakref.WeakValueDictionary[tuple, threading.Lock] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        # Per-process secret so password fingerprints in keys cannot be reversed or precomputed
+        self._key_secret = os.urandom(32)
+    
+    def make_key(self, url: Optional[str], username: Optional[str],
+                 profile: Optional[str], verify_cert: bool,
+                 password: Optional[str] = None) -> tuple:
+        """
+        Build the registry key for a set of connection parameters.
+        
+        An explicit password is part of the key as an HMAC fingerprint, so a
+        pooled session is only handed to callers presenting the same credentials
+        that created it.
+        """
+        fingerprint = None
+        if password is not None:
+            fingerprint = hmac.new(self._key_secret, password.encode(), hashlib.sha256).hexdigest()
+        return ((url or "home").rstrip('/').lower(), username, profile, bool(verify_cert), fingerprint)
+    
+    def _key_lock(self, key: tuple) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+    
+    def _evict_idle(self, now: float) -> None:
+        """Drop entries that have not been used within the idle timeout. Caller holds the lock."""
+        for key in [k for k, e in self._entries.items() if now - e["last_used"] > self.idle_timeout]:
+            self._entries.pop(key)
+            self.logger.debug("Evicted idle GIS connection for %s", key[0])
+    
+    def checkout(self, key: tuple, factory, validator) -> Any:
+        """
+        Return a live connection for ``key``, creating one with ``factory`` if needed.
+        
+        Args:
+            key: Registry key from ``make_key``
+            factory: Callable returning a new validated GIS object, or None on failure
+            validator: Callable taking a GIS object and returning True if it is healthy
+            
+        Returns:
+            GIS connection object or None if no connection could be established
+        """
+        with self._key_lock(key):
+            now = time.monotonic()
+            with self._lock:
+                self._evict_idle(now)
+                entry = self._entries.get(key)
+            
+            if entry is not None:
+                if now - entry["last_checked"] >= self.health_check_interval:
+                    if validator(entry["gis"]):
+                        entry["last_checked"] = now
+                    else:
+                        self.logger.warning(f"Pooled GIS connection for {key[0]} failed health check")
+                        self.discard(key)
+                        entry = None
+            
+            if entry is not None:
+                with self._lock:
+                    entry["last_used"] = now
+                    if key in self._entries:
+                        self._entries.move_to_end(key)
+                self.logger.info(f"Reusing pooled GIS connection for {key[0]}")
+                return entry["gis"]
+            
+            gis = factory()
+            if gis is not None:
+                self._add(key, gis)
+            return gis
+    
+    def _add(self, key: tuple, gis: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = {"gis": gis, "created": now, "last_used": now, "last_checked": now}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self.logger.debug("Evicted GIS connection for %s (pool full)", evicted_key[0])
+    
+    def discard(self, key: tuple) -> None:
+        """Remove a connection from the pool, e.g. after it has failed."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all pooled connections."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class ArcGISConnectionManager:
     """
     Manages connections to ArcGIS portals with intelligent certificate handling.
@@ -218,11 +1080,22 @@ class ArcGISConnectionManager:
     performance monitoring.
     """
     
-    def __init__(self, logger: Optional[SimpleLogger] = None):
+    def __init__(self, logger: Optional[SimpleLogger] = None,
+                 cert_manager: Optional[ArcGISCertificateManager] = None,
+                 credential_manager: Optional[SecureCredentialManager] = None,
+                 connection_pool: Optional[GISConnectionPool] = None,
+                 race_strategies: bool = False, race_stagger: float = 0.5):
         self.logger = logger or SimpleLogger("connection_manager")
-        self.cert_manager = ArcGISCertificateManager(logger=self.logger)
-        self.credential_manager = SecureCredentialManager(logger=self.logger)
+        self.race_strategies = race_strategies
+        self.race_stagger = race_stagger
+        self._preferred_strategies: dict[str, str] = {}
+        self._strategy_lock = threading.Lock()
+        self.connection_pool = connection_pool if connection_pool is not None else GISConnectionPool(logger=self.logger)
+        self.cert_manager = cert_manager or ArcGISCertificateManager(logger=self.logger)
+        self.session_pool = self.cert_manager.session_pool
+        self.credential_manager = credential_manager or SecureCredentialManager(logger=self.logger)
         
+    @traced
     def _validate_connection(self, gis) -> bool:
         """
         Validate that a GIS connection is functional.
@@ -243,13 +1116,36 @@ class ArcGISConnectionManager:
             self.logger.error(f"Connection validation failed: {str(e)}")
             return False
     
+    def probe_portal(self, url: str, timeout: float = 10) -> bool:
+        """
+        Check that a portal responds over HTTPS using the shared session pool.
+        
+        Args:
+            url: Portal URL to probe
+            timeout: Request timeout in seconds
+            
+        Returns:
+            bool: True if the portal answered with a non-server-error status
+        """
+        try:
+            verify = self.cert_manager.get_verified_certificate(url) or True
+            response = self.session_pool.get(url, verify=verify, timeout=timeout)
+            return response.status_code < 500
+        except Exception as e:
+            self.logger.warning(f"Portal probe failed for {url}: {str(e)}")
+            return False
+    
     @timed_function
     def connect_to_portal(self, url: Optional[str] = None, 
                          username: Optional[str] = None,
                          password: Optional[str] = None, 
                          profile: Optional[str] = None,
                          verify_cert: bool = True,
-                         use_secure_credentials: bool = True) -> Any:
+                         use_secure_credentials: bool = True,
+                         use_pool: bool = False,
+                         service_name: str = "ArcGIS",
+                         allow_prompt: bool = True,
+                         race: Optional[bool] = None) -> Any:
         """
         Connect to ArcGIS Enterprise or ArcGIS Online with comprehensive error handling.
         
@@ -260,19 +1156,38 @@ class ArcGISConnectionManager:
             profile: Profile name for authentication
             verify_cert: Whether to verify SSL certificates
             use_secure_credentials: Whether to use secure credential retrieval methods
+            use_pool: Reuse a live connection from the connection pool when available
+            service_name: Credential store service name used for secure credential retrieval
+            allow_prompt: Whether secure credential retrieval may prompt for a password
+            race: Race the certificate strategies concurrently (defaults to ``race_strategies``)
             
         Returns:
             GIS connection object or None if connection fails
         """
+        if use_pool:
+            key = self.connection_pool.make_key(url, username, profile, verify_cert, password)
+            return self.connection_pool.checkout(
+                key,
+                lambda: self._connect(url, username, password, profile, verify_cert,
+                                      use_secure_credentials, service_name, allow_prompt, race),
+                self._validate_connection
+            )
+        return self._connect(url, username, password, profile, verify_cert, use_secure_credentials,
+                             service_name, allow_prompt, race)
+    
+    def _connect(self, url: Optional[str], username: Optional[str], password: Optional[str],
+                 profile: Optional[str], verify_cert: bool, use_secure_credentials: bool,
+                 service_name: str = "ArcGIS", allow_prompt: bool = True,
+                 race: Optional[bool] = None) -> Any:
+        """Establish and validate a new connection, applying fallback strategies."""
+        race = self.race_strategies if race is None else race
         try:
-            # Import arcgis module
-            from arcgis.gis import GIS
-            
             # Handle secure credential retrieval
             if use_secure_credentials and not profile:
                 if not username or not password:
                     self.logger.info("Using secure credential retrieval")
-                    secure_username, secure_password = self.credential_manager.get_credential(username)
+                    secure_username, secure_password = self.credential_manager.get_credential(
+                        username, service_name, allow_prompt=allow_prompt)
                     if secure_username and secure_password:
                         username = secure_username
                         password = secure_password
@@ -296,10 +1211,36 @@ class ArcGISConnectionManager:
             else:
                 gis_kwargs['verify_cert'] = verify_cert
             
+            strategies = {'primary': gis_kwargs}
+            if 'ca_bundles' in gis_kwargs:
+                strategies['legacy'] = self._legacy_kwargs(gis_kwargs)
+            
+            # Go straight to the strategy that last worked for this portal. Without
+            # racing, the primary strategy is tried first below anyway.
+            portal_key = self._strategy_key(url, profile)
+            preferred = self._preferred_strategies.get(portal_key)
+            if preferred in strategies and (race or preferred != 'primary'):
+                gis = self._try_strategy(preferred, url, username, password, profile, strategies[preferred])
+                if gis:
+                    return gis
+                self._forget_strategy(portal_key)
+            
+            if race and len(strategies) > 1:
+                gis, errors = self._race_strategies(url, username, password, profile, strategies)
+                if gis:
+                    return gis
+                if any(self._is_certificate_error(error) for error in errors):
+                    if url:
+                        self.cert_manager.invalidate_cache(url)
+                    self.logger.warning("SSL certificate verification failed, trying with verify_cert=False...")
+                    return self._retry_without_verification(url, username, password, profile)
+                raise Exception(f"All connection strategies failed: {'; '.join(errors)}")
+            
             # Attempt connection with primary strategy
             try:
                 gis = self._attempt_connection(url, username, password, profile, gis_kwargs)
                 if gis and self._validate_connection(gis):
+                    self._remember_strategy(portal_key, 'primary')
                     return gis
                 else:
                     raise Exception("Connection validation failed")
@@ -308,29 +1249,155 @@ class ArcGISConnectionManager:
                 error_str = str(e).lower()
                 
                 # Handle certificate-related errors
-                if any(cert_error in error_str for cert_error in [
-                    "certificate verify failed", "ssl error", "ssl certificate", "certificate_verify_failed"
-                ]):
+                if self._is_certificate_error(error_str):
+                    if url:
+                        self.cert_manager.invalidate_cache(url)
                     self.logger.warning("SSL certificate verification failed, trying with verify_cert=False...")
                     return self._retry_without_verification(url, username, password, profile)
                 
                 # Handle API version compatibility issues
                 elif "ca_bundles" in error_str or "unexpected keyword argument" in error_str:
                     self.logger.warning("ca_bundles not supported, trying legacy approach...")
-                    return self._retry_legacy_certificates(url, username, password, profile, gis_kwargs)
+                    gis = self._retry_legacy_certificates(url, username, password, profile, gis_kwargs)
+                    if gis:
+                        self._remember_strategy(portal_key, 'legacy')
+                    return gis
                 
                 else:
                     raise
                 
         except Exception as e:
+            if username and self._is_auth_error(str(e)):
+                self.credential_manager.invalidate(username, service_name)
             self.logger.error(f"Failed to connect to ArcGIS portal: {str(e)}")
             return None
     
+    @staticmethod
+    def _is_certificate_error(error: str) -> bool:
+        """Check whether an error message indicates an SSL certificate failure."""
+        error = error.lower()
+        return any(cert_error in error for cert_error in [
+            "certificate verify failed", "ssl error", "ssl certificate", "certificate_verify_failed"
+        ])
+    
+    # Status codes only count when labelled as such, so ports, item ids or row
+    # counts containing the digits do not look like rejected credentials
+    _AUTH_STATUS_PATTERN = re.compile(
+        r"\b(?:error code|status(?: code)?|http(?: error)?)\W*(?:401|498|499)\b"
+        r"|\b401 (?:client error|unauthorized)\b"
+    )
+    
+    @classmethod
+    def _is_auth_error(cls, error: str) -> bool:
+        """Check whether an error message indicates rejected credentials."""
+        error = error.lower()
+        if cls._AUTH_STATUS_PATTERN.search(error):
+            return True
+        return any(auth_error in error for auth_error in [
+            "invalid username or password", "unable to generate token", "invalid token",
+            "token required", "unauthorized", "authentication failed"
+        ])
+    
+    @staticmethod
+    def _legacy_kwargs(original_kwargs: dict) -> dict:
+        """Translate ``ca_bundles`` kwargs into the legacy ``verify_cert=<path>`` form."""
+        fallback_kwargs = original_kwargs.copy()
+        cert_path = fallback_kwargs.pop('ca_bundles', None)
+        
+        if cert_path:
+            fallback_kwargs['verify_cert'] = cert_path
+        return fallback_kwargs
+    
+    @staticmethod
+    def _strategy_key(url: Optional[str], profile: Optional[str]) -> str:
+        return f"{(url or 'home').rstrip('/').lower()}|{profile or ''}"
+    
+    def _remember_strategy(self, portal_key: str, strategy: str) -> None:
+        with self._strategy_lock:
+            if self._preferred_strategies.get(portal_key) != strategy:
+                self.logger.debug("Remembering '%s' connection strategy for %s", strategy, portal_key)
+            self._preferred_strategies[portal_key] = strategy
+    
+    def _forget_strategy(self, portal_key: str) -> None:
+        with self._strategy_lock:
+            self._preferred_strategies.pop(portal_key, None)
+    
+    def _try_strategy(self, name: str, url: Optional[str], username: Optional[str],
+                      password: Optional[str], profile: Optional[str], gis_kwargs: dict) -> Any:
+        """Attempt and validate a single strategy, returning None on any failure."""
+        try:
+            gis = self._attempt_connection(url, username, password, profile, gis_kwargs)
+            if gis and self._validate_connection(gis):
+                self.logger.info(f"Connected using remembered '{name}' strategy")
+                return gis
+        except Exception as e:
+            self.logger.warning(f"Remembered '{name}' strategy failed: {str(e)}")
+        return None
+    
+    def _race_strategies(self, url: Optional[str], username: Optional[str],
+                         password: Optional[str], profile: Optional[str],
+                         strategies: dict) -> tuple[Any, list[str]]:
+        """
+        Run the verified-certificate strategies concurrently with staggered starts.
+        
+        Each strategy starts ``race_stagger`` seconds after the previous one, or
+        immediately once the previous one fails. The first validated connection
+        wins; strategies that have not started yet are cancelled and late
+        results are discarded. Unverified connections are never raced.
+        
+        Returns:
+            tuple: (GIS connection or None, list of failure messages)
+        """
+        names = list(strategies)
+        start_events = [threading.Event() for _ in names]
+        start_events[0].set()
+        cancelled = threading.Event()
+        
+        def attempt(index: int, name: str) -> Any:
+            start_events[index].wait(self.race_stagger * index)
+            if cancelled.is_set():
+                return None
+            try:
+                gis = self._attempt_connection(url, username, password, profile, strategies[name])
+                if gis and self._validate_connection(gis):
+                    return gis
+                raise Exception("Connection validation failed")
+            except Exception:
+                if index + 1 < len(start_events):
+                    start_events[index + 1].set()
+                raise
+        
+        self.logger.info(f"Racing connection strategies: {', '.join(names)}")
+        executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="connect_race")
+        # Each attempt runs in a copy of the caller's context so its spans nest under the connect span
+        futures = {executor.submit(contextvars.copy_context().run, attempt, i, name): name
+                   for i, name in enumerate(names)}
+        errors = []
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    gis = future.result()
+                except Exception as e:
+                    errors.append(f"{name}: {str(e)}")
+                    continue
+                if gis is not None:
+                    self.logger.info(f"Connected using '{name}' strategy")
+                    self._remember_strategy(self._strategy_key(url, profile), name)
+                    return gis, errors
+        finally:
+            cancelled.set()
+            for event in start_events:
+                event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return None, errors
+    
+    @traced
     def _attempt_connection(self, url: Optional[str], username: Optional[str], 
                           password: Optional[str], profile: Optional[str], 
                           gis_kwargs: dict) -> Any:
         """Attempt connection with given parameters."""
-        from arcgis.gis import GIS
+        GIS = _gis_class()
         
         if profile:
             gis = GIS(url, username, password, profile=profile, **gis_kwargs)
@@ -348,8 +1415,6 @@ class ArcGISConnectionManager:
     def _retry_without_verification(self, url: Optional[str], username: Optional[str], 
                                   password: Optional[str], profile: Optional[str]) -> Any:
         """Retry connection with SSL verification disabled."""
-        from arcgis.gis import GIS
-        
         retry_kwargs = {'verify_cert': False}
         
         try:
@@ -367,13 +1432,7 @@ class ArcGISConnectionManager:
                                  password: Optional[str], profile: Optional[str], 
                                  original_kwargs: dict) -> Any:
         """Retry connection using legacy certificate approach."""
-        from arcgis.gis import GIS
-        
-        fallback_kwargs = original_kwargs.copy()
-        cert_path = fallback_kwargs.pop('ca_bundles', None)
-        
-        if cert_path:
-            fallback_kwargs['verify_cert'] = cert_path
+        fallback_kwargs = self._legacy_kwargs(original_kwargs)
         
         try:
             gis = self._attempt_connection(url, username, password, profile, fallback_kwargs)
@@ -387,37 +1446,112 @@ class ArcGISConnectionManager:
             return None
 
 
+@dataclass
+class PortalCheckResult:
+    """Outcome of checking a single portal in a batch health check."""
+    name: str
+    url: str
+    certificate_ok: bool = False
+    connected: bool = False
+    certificate_seconds: Optional[float] = None
+    connect_seconds: Optional[float] = None
+    total_seconds: Optional[float] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.connected and self.error is None
+    
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def format_portal_results(results: Iterable[PortalCheckResult]) -> str:
+    """Render batch check results as a fixed-width text table."""
+    def fmt_seconds(value: Optional[float]) -> str:
+        return f"{value:.2f}s" if value is not None else "-"
+    
+    rows = [("PORTAL", "URL", "CERT", "CONNECTED", "CERT TIME", "CONNECT TIME", "TOTAL", "ERROR")]
+    for r in results:
+        rows.append((r.name, r.url, "ok" if r.certificate_ok else "FAIL", "yes" if r.connected else "NO",
+                     fmt_seconds(r.certificate_seconds), fmt_seconds(r.connect_seconds),
+                     fmt_seconds(r.total_seconds), r.error or ""))
+    widths = [max(len(str(row[i])) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip()
+                     for row in rows)
+
+
 class ArcGISUtils:
     """
     Main utility class combining certificate management and connection handling.
     Provides a simple interface for all ArcGIS connectivity needs.
     """
     
-    def __init__(self, log_file: Optional[str] = None, log_level: str = "INFO"):
+    def __init__(self, log_file: Optional[str] = None, log_level: str = "INFO",
+                 credential_cache_ttl: Optional[float] = None, warm_up: bool = False,
+                 enable_metrics: bool = False, async_logging: bool = False,
+                 race_strategies: bool = False, race_stagger: float = 0.5):
         # Initialize logger
-        self.logger = SimpleLogger("arcgis_utils", log_file, log_level)
+        self.logger = SimpleLogger("arcgis_utils", log_file, log_level, use_queue=async_logging)
+        
+        # Metrics are process-wide; enabling them here turns them on for all instances
+        self.metrics = metrics
+        if enable_metrics:
+            metrics.enabled = True
+        
+        # Optionally start importing heavy dependencies while the caller does other work
+        if warm_up:
+            warm_up_imports(background=True)
         
         # Initialize managers
-        self.cert_manager = ArcGISCertificateManager(logger=self.logger)
-        self.connection_manager = ArcGISConnectionManager(logger=self.logger)
-        self.credential_manager = SecureCredentialManager(logger=self.logger)
+        self.session_pool = HTTPSessionPool(logger=self.logger)
+        self.cert_manager = ArcGISCertificateManager(logger=self.logger, session_pool=self.session_pool)
+        self.credential_manager = SecureCredentialManager(logger=self.logger, cache_ttl=credential_cache_ttl)
+        self.connection_pool = GISConnectionPool(logger=self.logger)
+        self.connection_manager = ArcGISConnectionManager(
+            logger=self.logger,
+            cert_manager=self.cert_manager,
+            credential_manager=self.credential_manager,
+            connection_pool=self.connection_pool,
+            race_strategies=race_strategies,
+            race_stagger=race_stagger
+        )
         
         self.logger.info("ArcGIS Utils initialized")
     
-    def verify_certificate(self, url: str) -> Optional[str]:
-        """Verify SSL certificate for a given URL."""
-        return self.cert_manager.get_verified_certificate(url)
+    def verify_certificate(self, url: str, use_cache: Optional[bool] = None) -> Optional[str]:
+        """Verify SSL certificate for a given URL, reusing a cached verification when valid."""
+        return self.cert_manager.get_verified_certificate(url, use_cache=use_cache)
     
     def connect(self, url: Optional[str] = None, username: Optional[str] = None,
                 password: Optional[str] = None, profile: Optional[str] = None,
-                verify_cert: bool = True, use_secure_credentials: bool = True) -> Any:
-        """Connect to ArcGIS portal with full error handling and secure credential management."""
-        return self.connection_manager.connect_to_portal(url, username, password, profile, verify_cert, use_secure_credentials)
+                verify_cert: bool = True, use_secure_credentials: bool = True,
+                use_pool: bool = False, service_name: str = "ArcGIS",
+                race: Optional[bool] = None) -> Any:
+        """
+        Connect to ArcGIS portal with full error handling and secure credential management.
+        
+        Set ``use_pool=True`` to reuse a live, validated connection for the same
+        url/username/profile/verify_cert combination instead of reconnecting.
+        ``race`` overrides the instance's ``race_strategies`` setting for this call.
+        """
+        return self.connection_manager.connect_to_portal(url, username, password, profile, verify_cert,
+                                                         use_secure_credentials, use_pool=use_pool,
+                                                         service_name=service_name, race=race)
     
     def get_stored_credentials(self, username: str, service_name: str = "ArcGIS") -> tuple[Optional[str], Optional[str]]:
         """Retrieve stored credentials from Windows Credential Manager."""
         return self.credential_manager.get_credential(username, service_name)
     
+    def export_metrics(self, path: str, format: str = "json") -> None:
+        """Write recorded timing metrics to a JSON or Prometheus text file."""
+        self.metrics.export(path, format)
+    
+    def close(self) -> None:
+        """Release pooled HTTP sessions and GIS connections."""
+        self.connection_pool.clear()
+        self.session_pool.close()
+    
     def test_connection(self, url: str) -> bool:
         """Test if a connection to a portal URL is possible."""
         try:
@@ -425,6 +1559,211 @@ class ArcGISUtils:
             return gis is not None
         except Exception:
             return False
+    
+    def _check_portal(self, name: str, portal: dict, connect: bool, use_pool: bool) -> PortalCheckResult:
+        """Verify certificates for, connect to and validate one portal."""
+        url = portal["portal_url"]
+        result = PortalCheckResult(name=name, url=url)
+        start = time.perf_counter()
+        try:
+            cert_start = time.perf_counter()
+            result.certificate_ok = self.cert_manager.get_verified_certificate(url) is not None
+            result.certificate_seconds = time.perf_counter() - cert_start
+            
+            if connect:
+                connect_start = time.perf_counter()
+                gis = self.connection_manager.connect_to_portal(
+                    url=url,
+                    username=portal.get("service_account"),
+                    service_name=portal.get("service_name", "ArcGIS"),
+                    use_pool=use_pool,
+                    allow_prompt=False
+                )
+                result.connect_seconds = time.perf_counter() - connect_start
+                result.connected = gis is not None
+                if not result.connected:
+                    result.error = "connection or validation failed"
+            else:
+                result.connected = self.connection_manager.probe_portal(url)
+                if not result.connected:
+                    result.error = "portal did not respond"
+            
+            if not result.certificate_ok and result.error is None:
+                result.error = "certificate verification failed"
+        except Exception as e:
+            result.error = str(e)
+        result.total_seconds = time.perf_counter() - start
+        return result
+    
+    def check_portals(self, portals: Union[Iterable[Union[str, dict]], Mapping[str, dict]],
+                      max_workers: Optional[int] = None, timeout: float = 60,
+                      connect: bool = True, use_pool: bool = False) -> list[PortalCheckResult]:
+        """
+        Check many portals concurrently.
+        
+        Each portal goes through certificate verification, credential lookup,
+        connection and validation on its own worker thread, so total wall time
+        approaches that of the slowest portal. Credential lookup never prompts.
+        
+        Args:
+            portals: Portal URLs, environment dicts with a ``portal_url`` key, or a
+                mapping of environment name to such dicts (e.g. the ``environments``
+                block of ``gis_config.json``)
+            max_workers: Worker thread count (defaults to one per portal)
+            timeout: Per-portal time limit in seconds, measured from when its check starts
+            connect: Connect and validate as well as verifying certificates; when False
+                only an HTTP probe is made
+            use_pool: Reuse and populate the connection pool
+            
+        Returns:
+            list[PortalCheckResult]: One result per portal, in input order
+        """
+        if isinstance(portals, Mapping):
+            items = [(name, dict(cfg)) for name, cfg in portals.items()]
+        else:
+            items = [(p, {"portal_url": p}) if isinstance(p, str) else (p.get("name", p["portal_url"]), dict(p))
+                     for p in portals]
+        if not items:
+            return []
+        
+        results: list[Optional[PortalCheckResult]] = [None] * len(items)
+        started: dict[int, float] = {}
+        
+        def run(index: int, name: str, portal: dict) -> PortalCheckResult:
+            started[index] = time.perf_counter()
+            return self._check_portal(name, portal, connect, use_pool)
+        
+        self.logger.info(f"Checking {len(items)} portals concurrently")
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(items), thread_name_prefix="portal_check")
+        try:
+            pending = {executor.submit(contextvars.copy_context().run, run, i, name, portal): i
+                       for i, (name, portal) in enumerate(items)}
+            while pending:
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        name, portal = items[index]
+                        results[index] = PortalCheckResult(name=name, url=portal["portal_url"], error=str(e))
+                
+                now = time.perf_counter()
+                for future, index in list(pending.items()):
+                    if index in started and now - started[index] > timeout:
+                        future.cancel()
+                        pending.pop(future)
+                        name, portal = items[index]
+                        results[index] = PortalCheckResult(name=name, url=portal["portal_url"],
+                                                           total_seconds=now - started[index],
+                                                           error=f"timed out after {timeout:g}s")
+                        self.logger.warning(f"Portal check for {name} timed out")
+        finally:
+            # Timed-out checks cannot be interrupted; let them finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        failures = sum(1 for r in results if not r.ok)
+        self.logger.info(f"Portal checks complete: {len(results) - failures} ok, {failures} failed")
+        return results
+    
+    def check_environments(self, config_path: str = "gis_config.json",
+                           environments: Optional[Iterable[str]] = None, **kwargs) -> list[PortalCheckResult]:
+        """
+        Concurrently check the portals listed in a config file's ``environments`` block.
+        
+        Args:
+            config_path: Path to a JSON config in the ``gis_config.json`` format
+            environments: Environment names to check (defaults to all)
+            **kwargs: Passed through to ``check_portals``
+        """
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        envs = config.get("environments", {})
+        if environments is not None:
+            envs = {name: envs[name] for name in environments}
+        return self.check_portals(envs, **kwargs)
+
+
+class AsyncArcGISUtils:
+    """
+    Asyncio facade over ArcGISUtils for event-loop based services.
+    
+    Certificate probes, GIS construction, validation and keyring lookups run on a
+    bounded thread pool so they never block the loop.
+    """
+    
+    def __init__(self, utils: Optional[ArcGISUtils] = None, max_workers: int = 32,
+                 log_file: Optional[str] = None, log_level: str = "INFO"):
+        self.utils = utils or ArcGISUtils(log_file=log_file, log_level=log_level)
+        self.logger = self.utils.logger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="arcgis_async")
+    
+    async def _run_blocking(self, func, *args, **kwargs) -> Any:
+        """Run a blocking call on the bounded executor."""
+        loop = _lazy_import("asyncio").get_running_loop()
+        call = partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+    
+    async def verify_certificate(self, url: str, use_cache: Optional[bool] = None,
+                                 timeout: float = 10) -> Optional[str]:
+        """
+        Verify the portal's SSL certificate without blocking the event loop.
+        
+        Runs the same HTTPS probe as the synchronous API on the executor, so both
+        paths agree and share the certificate manager's verification cache.
+        
+        Args:
+            url: The portal URL to verify certificates for
+            use_cache: Override the certificate manager's cache setting for this call
+            timeout: Probe timeout in seconds
+            
+        Returns:
+            Optional[str]: Path to certificate bundle if successful, None if verification fails
+        """
+        return await self._run_blocking(self.utils.cert_manager.get_verified_certificate, url,
+                                        use_cache=use_cache, timeout=timeout)
+    
+    async def connect(self, url: Optional[str] = None, username: Optional[str] = None,
+                      password: Optional[str] = None, profile: Optional[str] = None,
+                      verify_cert: bool = True, use_secure_credentials: bool = True,
+                      use_pool: bool = False, service_name: str = "ArcGIS") -> Any:
+        """Connect to an ArcGIS portal; see ``ArcGISUtils.connect``."""
+        if verify_cert and url:
+            # Warm the certificate cache without blocking so the worker skips the probe
+            await self.verify_certificate(url)
+        return await self._run_blocking(self.utils.connect, url, username, password, profile,
+                                        verify_cert, use_secure_credentials, use_pool=use_pool,
+                                        service_name=service_name)
+    
+    async def get_stored_credentials(self, username: str,
+                                     service_name: str = "ArcGIS") -> tuple[Optional[str], Optional[str]]:
+        """Retrieve stored credentials without blocking on the keyring backend."""
+        return await self._run_blocking(self.utils.get_stored_credentials, username, service_name)
+    
+    async def test_connection(self, url: str) -> bool:
+        """Test if a connection to a portal URL is possible."""
+        try:
+            gis = await self.connect(url=url)
+            return gis is not None
+        except Exception:
+            return False
+    
+    async def test_connections(self, urls: Iterable[str]) -> dict[str, bool]:
+        """Test many portal URLs concurrently."""
+        urls = list(urls)
+        results = await _lazy_import("asyncio").gather(*(self.test_connection(url) for url in urls))
+        return dict(zip(urls, results))
+    
+    async def close(self) -> None:
+        """Shut down the executor and release pooled resources."""
+        await _lazy_import("asyncio").get_running_loop().run_in_executor(None, partial(self._executor.shutdown, wait=True))
+        self.utils.close()
+    
+    async def __aenter__(self) -> 'AsyncArcGISUtils':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
 
 def main():
@@ -445,7 +1784,7 @@ def main():
     
     # Example 2: Windows Credential Manager availability check
     print("\n2. Windows Credential Manager Integration...")
-    if KEYRING_AVAILABLE:
+    if keyring_available():
         print("   [SUCCESS] Windows Credential Manager available for secure credential retrieval")
     else:
         print("   [WARNING] Install 'keyring' package for Windows Credential Manager support")
@@ -479,5 +1818,50 @@ def main():
     print("  cmdkey /generic:ArcGIS /user:your_username /pass:your_password")
 
 
+def benchmark_startup(runs: int = 5, include_init: bool = True) -> dict:
+    """
+    Measure cold-start time of this module in fresh interpreter processes.
+    
+    Args:
+        runs: Number of interpreter launches per scenario
+        include_init: Also time constructing ``ArcGISUtils`` after import
+        
+    Returns:
+        dict: Scenario name mapped to min/median/max seconds
+    """
+    import statistics
+    import subprocess
+    
+    module_dir = str(Path(__file__).resolve().parent)
+    scenarios = {
+        "interpreter": "pass",
+        "import arcgis_utils": "import arcgis_utils",
+    }
+    if include_init:
+        scenarios["import + ArcGISUtils()"] = (
+            "import arcgis_utils; arcgis_utils.ArcGISUtils(log_level='WARNING')"
+        )
+    
+    results = {}
+    for name, code in scenarios.items():
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=module_dir, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append(time.perf_counter() - start)
+        results[name] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "max": max(timings)
+        }
+    return results
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--benchmark-startup" in sys.argv:
+        for scenario, stats in benchmark_startup().items():
+            print(f"{scenario:<28} min {stats['min'] * 1000:7.1f} ms   "
+                  f"median {stats['median'] * 1000:7.1f} ms   max {stats['max'] * 1000:7.1f} ms")
+    else:
+        main()
\ No newline at end of file
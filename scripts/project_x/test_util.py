@@ -0,0 +1,110 @@
+"""Behaviour checks for util. Run with ``python -m pytest scripts/project_x``."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from util import QuantileSketch, TrendAccumulator, analyze_trends, parallel_analyze_trends
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2024-01-01', periods=1_000, freq='h')
+    return pd.DataFrame({'date': dates, 'value': np.arange(1_000) * 0.1 + rng.normal(size=1_000)})
+
+
+def test_trends_without_valid_dates():
+    df = pd.DataFrame({'date': [pd.NaT] * 3, 'value': [1.0, 2.0, 3.0]})
+    expected = analyze_trends(df, 'date', 'value')
+    assert expected['trend'] == 'decreasing'
+    assert expected['mean'] == 2.0
+    assert parallel_analyze_trends(df, 'date', 'value', n_workers=1)['trend'] == expected['trend']
+    assert TrendAccumulator('date', 'value').update(df).result()['trend'] == expected['trend']
+
+
+def test_trend_accumulator_matches_batch_analysis(series):
+    acc = TrendAccumulator('date', 'value')
+    for start in range(0, len(series), 128):
+        acc.update(series.iloc[start:start + 128])
+    result = acc.result()
+    expected = analyze_trends(series, 'date', 'value')
+    for key in ('mean', 'std', 'min', 'max'):
+        assert result[key] == pytest.approx(expected[key])
+    assert result['trend'] == expected['trend']
+    assert result['count'] == len(series)
+
+
+def test_trend_accumulator_save_load_round_trip(series, tmp_path):
+    path = str(tmp_path / 'trend.json')
+    acc = TrendAccumulator('date', 'value').update(series.iloc[:600])
+    acc.save(path)
+    restored = TrendAccumulator.load(path)
+    original = acc.result()
+    for key, value in restored.result().items():
+        if isinstance(value, str):
+            assert value == original[key]
+        else:
+            assert value == pytest.approx(original[key], nan_ok=True)
+
+    # Continuing from the saved state gives the same result as never stopping
+    restored.update(series.iloc[600:])
+    acc.update(series.iloc[600:])
+    assert restored.result()['mean'] == pytest.approx(acc.result()['mean'])
+    assert restored.result()['slope'] == pytest.approx(acc.result()['slope'])
+    assert restored.result()['trend'] == acc.result()['trend']
+
+
+def test_trend_accumulator_load_missing_file(tmp_path):
+    path = str(tmp_path / 'missing.json')
+    assert TrendAccumulator.load(path, 'date', 'value').count == 0
+    with pytest.raises(FileNotFoundError):
+        TrendAccumulator.load(path)
+
+
+def test_parallel_trends_approximate_median(series):
+    exact = parallel_analyze_trends(series, 'date', 'value', n_workers=2)
+    approximate = parallel_analyze_trends(series, 'date', 'value', n_workers=2, approximate=True)
+    assert exact['median'] == pytest.approx(series['value'].median())
+    # Rank error of the default sketch is about 1%
+    rank = (series['value'] <= approximate['median']).mean()
+    assert abs(rank - 0.5) < 0.03
+    assert approximate['mean'] == pytest.approx(exact['mean'])
+
+
+def _rank_errors(sketch, values, qs):
+    ordered = np.sort(values)
+    estimates = sketch.quantile(qs)
+    return np.abs(np.searchsorted(ordered, estimates, side='right') / len(ordered) - np.asarray(qs))
+
+
+def test_quantile_sketch_rank_error_within_bound():
+    values = np.random.default_rng(0).lognormal(size=100_000)
+    sketch = QuantileSketch(k=200, seed=0)
+    for start in range(0, len(values), 7_000):
+        sketch.update(values[start:start + 7_000])
+    qs = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+    assert _rank_errors(sketch, values, qs).max() < 3 / sketch.k
+    assert sketch.count == len(values)
+    assert sum(len(level) for level in sketch.levels) <= 3 * sketch.k
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_quantile_sketch_merge_approximates_union():
+    rng = np.random.default_rng(1)
+    left, right = rng.normal(size=60_000), rng.normal(loc=5, size=40_000)
+    merged = QuantileSketch(seed=0).update(left).merge(QuantileSketch(seed=1).update(right))
+    qs = [0.1, 0.4, 0.5, 0.6, 0.9]
+    union = np.concatenate([left, right])
+    assert _rank_errors(merged, union, qs).max() < 3 / merged.k
+    assert merged.count == len(union)
+    assert merged.min == union.min() and merged.max == union.max()
+
+
+def test_quantile_sketch_empty_and_nan_input():
+    sketch = QuantileSketch().update([np.nan, np.nan])
+    assert sketch.count == 0
+    assert np.isnan(sketch.quantile(0.5))
+    assert np.isnan(sketch.quantile([0.25, 0.75])).all()
+    assert sketch.merge(QuantileSketch()).count == 0
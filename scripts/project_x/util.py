@@ -5,9 +5,15 @@ Helper functions for data manipulation and cleaning using Pandas.
 Provides common operations for data preprocessing and analysis.
 """
 
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, Iterable, Tuple
+
+DATA_FILE_EXTENSIONS = ('.csv', '.parquet', '.json', '.jsonl')
 
 def clean_data(df: pd.DataFrame, 
                drop_nulls: bool = True,
@@ -50,20 +56,26 @@ def analyze_trends(df: pd.DataFrame,
     Returns:
         Dictionary with trend analysis results
     """
-    # Ensure date column is datetime
-    df[date_column] = pd.to_datetime(df[date_column])
+    # Convert a copy of the date column; the caller's frame is left untouched
+    dates = pd.to_datetime(df[date_column])
+    values = df[value_column]
     
-    # Sort by date
-    df_sorted = df.sort_values(date_column)
+    # Earliest and latest observations, without sorting the whole frame; with no
+    # valid dates there is nothing to compare, as in TrendAccumulator
+    if dates.notna().any():
+        first_value = values.iloc[dates.argmin()]
+        last_value = values.iloc[dates.argmax()]
+    else:
+        first_value = last_value = np.nan
     
     # Calculate basic statistics
     results = {
-        'mean': df_sorted[value_column].mean(),
-        'median': df_sorted[value_column].median(),
-        'std': df_sorted[value_column].std(),
-        'min': df_sorted[value_column].min(),
-        'max': df_sorted[value_column].max(),
-        'trend': 'increasing' if df_sorted[value_column].iloc[-1] > df_sorted[value_column].iloc[0] else 'decreasing'
+        'mean': values.mean(),
+        'median': values.median(),
+        'std': values.std(),
+        'min': values.min(),
+        'max': values.max(),
+        'trend': 'increasing' if last_value > first_value else 'decreasing'
     }
     
     return results
@@ -81,31 +93,664 @@ def export_summary(df: pd.DataFrame, filename: str) -> None:
     print(f"Summary exported to {filename}")
 
 def filter_outliers(df: pd.DataFrame, 
-                   column: str,
-                   method: str = 'iqr') -> pd.DataFrame:
+                   column: Union[str, List[str]],
+                   method: str = 'iqr',
+                   approximate: bool = False,
+                   sketch_size: int = 200) -> pd.DataFrame:
     """
-    Filter outliers from a DataFrame column.
+    Filter outliers from one or more DataFrame columns.
+    
+    When several columns are given, all bounds are computed from the input in
+    a single pass and rows are kept only if every column lies within its bounds.
     
     Args:
         df: Input DataFrame
+        column: Column name, or list of column names, to filter outliers from
+        method: Method to use ('iqr' or 'zscore')
+        approximate: Use a QuantileSketch instead of exact quartiles ('iqr' only)
+        sketch_size: Accuracy parameter of the sketch when approximate is set
+    
+    Returns:
+        DataFrame with outliers removed
+    """
+    columns = [column] if isinstance(column, str) else list(column)
+    bounds = outlier_bounds(df, columns, method=method,
+                            approximate=approximate, sketch_size=sketch_size)
+    return apply_outlier_bounds(df, bounds, inclusive=(method == 'iqr'))
+
+
+def _merge_moments(a: Dict[str, float], b: Dict[str, float]) -> Dict[str, float]:
+    """Combine count/mean/M2 summaries of two partitions (Chan et al.)."""
+    if a['count'] == 0:
+        return dict(b)
+    if b['count'] == 0:
+        return dict(a)
+    count = a['count'] + b['count']
+    delta = b['mean'] - a['mean']
+    return {
+        'count': count,
+        'mean': a['mean'] + delta * b['count'] / count,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * a['count'] * b['count'] / count
+    }
+
+
+def _moments(values: np.ndarray) -> Dict[str, float]:
+    """Count, mean and sum of squared deviations of non-null values."""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'count': 0, 'mean': 0.0, 'm2': 0.0}
+    mean = values.mean()
+    return {'count': len(values), 'mean': mean, 'm2': ((values - mean) ** 2).sum()}
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantile sketch in the style of KLL.
+    
+    Values are kept in a hierarchy of compactors; when a level grows past its
+    capacity it is sorted and every other item is promoted to the next level
+    with twice the weight. Memory stays around ``3 * k`` values regardless of
+    how many are added, and the rank error is roughly ``1.7 / k`` (about 1%
+    for the default ``k=200``). Sketches built on separate chunks or processes
+    can be combined with ``merge``.
+    """
+    
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+    
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(items)
+            # An odd item stays behind so the total weight is preserved
+            keep, items = items[:len(items) % 2], items[len(items) % 2:]
+            promoted = items[self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            # Capacities shrink as the hierarchy grows, so re-check from the bottom
+            level = 0
+    
+    def update(self, values: Any) -> 'QuantileSketch':
+        """Add values to the sketch; NaNs are ignored."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Fold another sketch into this one."""
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+    
+    def quantile(self, q: Union[float, List[float]]) -> Union[float, np.ndarray]:
+        """
+        Estimate one or more quantiles.
+        
+        Args:
+            q: Quantile or list of quantiles in [0, 1]
+        
+        Returns:
+            Estimated value(s); NaN if the sketch is empty
+        """
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            result = np.full(len(qs), np.nan)
+        else:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(items), 2.0 ** level)
+                                      for level, items in enumerate(self.levels)])
+            order = np.argsort(items, kind='stable')
+            items, cumulative = items[order], np.cumsum(weights[order])
+            positions = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+            result = items[np.clip(positions, 0, len(items) - 1)]
+            result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return result if np.ndim(q) else float(result[0])
+
+
+def outlier_bounds(data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                   columns: List[str],
+                   method: str = 'iqr',
+                   approximate: bool = False,
+                   sketch_size: int = 200) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute outlier bounds for several columns in one pass.
+    
+    ``data`` may be a DataFrame or an iterable of DataFrame chunks (for
+    example ``pd.read_csv(path, chunksize=...)``). Chunked 'iqr' input always
+    uses quantile sketches, so the columns never have to fit in memory.
+    
+    Args:
+        data: DataFrame or iterable of DataFrame chunks
+        columns: Columns to compute bounds for
+        method: Method to use ('iqr' or 'zscore')
+        approximate: Use a QuantileSketch instead of exact quartiles ('iqr' only)
+        sketch_size: Accuracy parameter of the sketch
+    
+    Returns:
+        Dictionary mapping each column to its (lower, upper) bounds
+    """
+    if method not in ('iqr', 'zscore'):
+        raise ValueError("Method must be 'iqr' or 'zscore'")
+    
+    if isinstance(data, pd.DataFrame) and not approximate:
+        if method == 'iqr':
+            quartiles = data[columns].quantile([0.25, 0.75])
+            Q1, Q3 = quartiles.iloc[0], quartiles.iloc[1]
+            IQR = Q3 - Q1
+            return {col: (Q1[col] - 1.5 * IQR[col], Q3[col] + 1.5 * IQR[col]) for col in columns}
+        mean, std = data[columns].mean(), data[columns].std()
+        return {col: (mean[col] - 3 * std[col], mean[col] + 3 * std[col]) for col in columns}
+    
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    if method == 'iqr':
+        sketches = {col: QuantileSketch(sketch_size) for col in columns}
+        for chunk in chunks:
+            for col in columns:
+                sketches[col].update(chunk[col].to_numpy(dtype=float))
+        bounds = {}
+        for col, sketch in sketches.items():
+            Q1, Q3 = sketch.quantile([0.25, 0.75])
+            IQR = Q3 - Q1
+            bounds[col] = (Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)
+        return bounds
+    
+    moments = {col: {'count': 0, 'mean': 0.0, 'm2': 0.0} for col in columns}
+    for chunk in chunks:
+        for col in columns:
+            moments[col] = _merge_moments(moments[col], _moments(chunk[col].to_numpy(dtype=float)))
+    bounds = {}
+    for col, m in moments.items():
+        std = np.sqrt(m['m2'] / (m['count'] - 1)) if m['count'] > 1 else np.nan
+        bounds[col] = (m['mean'] - 3 * std, m['mean'] + 3 * std)
+    return bounds
+
+
+def apply_outlier_bounds(df: pd.DataFrame,
+                         bounds: Dict[str, Tuple[float, float]],
+                         inclusive: bool = True) -> pd.DataFrame:
+    """
+    Keep the rows whose values lie within the bounds of every column.
+    
+    Args:
+        df: Input DataFrame (or a single chunk of a larger dataset)
+        bounds: Dictionary of (lower, upper) bounds from ``outlier_bounds``
+        inclusive: Whether values equal to a bound are kept
+            (True for 'iqr', False for 'zscore')
+    
+    Returns:
+        DataFrame with outliers removed
+    """
+    if not bounds:
+        return df
+    columns = list(bounds)
+    lower = np.array([bounds[col][0] for col in columns], dtype=float)
+    upper = np.array([bounds[col][1] for col in columns], dtype=float)
+    values = df[columns].to_numpy(dtype=float)
+    with np.errstate(invalid='ignore'):
+        if inclusive:
+            mask = ((values >= lower) & (values <= upper)).all(axis=1)
+        else:
+            mask = ((values > lower) & (values < upper)).all(axis=1)
+    return df[mask]
+
+
+class TrendAccumulator:
+    """
+    Incremental version of ``analyze_trends`` for growing time series.
+    
+    Each call to ``update`` folds a batch of new rows into running statistics:
+    count, mean and variance of the values (Welford/Chan batch updates), the
+    co-moment of time and value for a least-squares slope, extremes, the
+    earliest and latest observations, and a QuantileSketch for the median.
+    The state can be saved to JSON and reloaded, so refreshing the analysis
+    costs O(new rows) rather than re-reading and sorting the full history.
+    
+    Example:
+        acc = TrendAccumulator.load('trend_state.json', 'timestamp', 'value')
+        acc.update(new_rows)
+        acc.save('trend_state.json')
+        print(acc.result())
+    """
+    
+    def __init__(self, date_column: str, value_column: str, sketch_size: int = 200):
+        self.date_column = date_column
+        self.value_column = value_column
+        self.sketch = QuantileSketch(sketch_size)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        # Regression state, with time measured in seconds since ``origin``
+        self.origin: Optional[pd.Timestamp] = None
+        self.n_xy = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.c_xy = 0.0
+        self.first: Optional[Tuple[pd.Timestamp, float]] = None
+        self.last: Optional[Tuple[pd.Timestamp, float]] = None
+    
+    def update(self, df: pd.DataFrame) -> 'TrendAccumulator':
+        """
+        Ingest a batch of new rows.
+        
+        Args:
+            df: DataFrame containing the date and value columns
+        
+        Returns:
+            The accumulator, to allow chaining
+        """
+        if len(df) == 0:
+            return self
+        dates = pd.to_datetime(df[self.date_column])
+        values = df[self.value_column].to_numpy(dtype=float)
+        
+        # Value moments and extremes
+        valid = ~np.isnan(values)
+        batch = _moments(values)
+        merged = _merge_moments({'count': self.count, 'mean': self.mean, 'm2': self.m2}, batch)
+        self.count, self.mean, self.m2 = merged['count'], merged['mean'], merged['m2']
+        if batch['count']:
+            self.min = np.nanmin([self.min, values[valid].min()])
+            self.max = np.nanmax([self.max, values[valid].max()])
+            self.sketch.update(values[valid])
+        
+        # Earliest and latest observations, matching analyze_trends
+        if dates.notna().any():
+            first, last = dates.argmin(), dates.argmax()
+            if self.first is None or dates.iloc[first] < self.first[0]:
+                self.first = (dates.iloc[first], values[first])
+            if self.last is None or dates.iloc[last] > self.last[0]:
+                self.last = (dates.iloc[last], values[last])
+        
+        # Time/value co-moments for the least-squares slope
+        paired = valid & dates.notna().to_numpy()
+        if paired.any():
+            if self.origin is None:
+                self.origin = dates[paired].min()
+            x = (dates[paired] - self.origin).dt.total_seconds().to_numpy()
+            y = values[paired]
+            n_b, mean_x_b, mean_y_b = len(x), x.mean(), y.mean()
+            m2_x_b = ((x - mean_x_b) ** 2).sum()
+            c_xy_b = ((x - mean_x_b) * (y - mean_y_b)).sum()
+            n = self.n_xy + n_b
+            dx, dy = mean_x_b - self.mean_x, mean_y_b - self.mean_y
+            self.m2_x += m2_x_b + dx * dx * self.n_xy * n_b / n
+            self.c_xy += c_xy_b + dx * dy * self.n_xy * n_b / n
+            self.mean_x += dx * n_b / n
+            self.mean_y += dy * n_b / n
+            self.n_xy = n
+        
+        return self
+    
+    @property
+    def slope(self) -> float:
+        """Least-squares slope of value against time, in value units per day."""
+        if self.n_xy < 2 or self.m2_x == 0:
+            return np.nan
+        return self.c_xy / self.m2_x * 86400
+    
+    def result(self) -> Dict[str, Any]:
+        """
+        Current trend analysis.
+        
+        Returns:
+            Dictionary with the same keys as ``analyze_trends`` plus 'slope'
+            and 'count'. The median is estimated from the quantile sketch.
+        """
+        first_value = self.first[1] if self.first else np.nan
+        last_value = self.last[1] if self.last else np.nan
+        return {
+            'mean': self.mean if self.count else np.nan,
+            'median': self.sketch.quantile(0.5),
+            'std': np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan,
+            'min': self.min,
+            'max': self.max,
+            'trend': 'increasing' if last_value > first_value else 'decreasing',
+            'slope': self.slope,
+            'count': self.count
+        }
+    
+    def save(self, path: str) -> None:
+        """
+        Persist the accumulator state to a JSON file.
+        
+        Args:
+            path: Output file path
+        """
+        def point(p):
+            return None if p is None else [p[0].isoformat(), float(p[1])]
+        
+        state = {
+            'date_column': self.date_column,
+            'value_column': self.value_column,
+            'count': self.count, 'mean': float(self.mean), 'm2': float(self.m2),
+            'min': float(self.min), 'max': float(self.max),
+            'origin': None if self.origin is None else self.origin.isoformat(),
+            'n_xy': self.n_xy, 'mean_x': float(self.mean_x), 'mean_y': float(self.mean_y),
+            'm2_x': float(self.m2_x), 'c_xy': float(self.c_xy),
+            'first': point(self.first), 'last': point(self.last),
+            'sketch': {
+                'k': self.sketch.k, 'count': self.sketch.count,
+                'min': float(self.sketch.min), 'max': float(self.sketch.max),
+                'levels': [level.tolist() for level in self.sketch.levels]
+            }
+        }
+        # The pid keeps concurrent refresh jobs from sharing a temp file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str, date_column: Optional[str] = None,
+             value_column: Optional[str] = None) -> 'TrendAccumulator':
+        """
+        Restore an accumulator saved with ``save``.
+        
+        If ``path`` does not exist yet, a fresh accumulator for the given
+        columns is returned, which makes the first run of a refresh job work
+        the same way as later ones.
+        
+        Args:
+            path: File written by ``save``
+            date_column: Date column to use when no state file exists
+            value_column: Value column to use when no state file exists
+        
+        Returns:
+            TrendAccumulator instance
+        """
+        if not os.path.exists(path):
+            if date_column is None or value_column is None:
+                raise FileNotFoundError(f"No trend state found at {path}")
+            return cls(date_column, value_column)
+        
+        with open(path, 'r') as f:
+            state = json.load(f)
+        
+        def point(p):
+            return None if p is None else (pd.Timestamp(p[0]), p[1])
+        
+        acc = cls(state['date_column'], state['value_column'], state['sketch']['k'])
+        acc.count, acc.mean, acc.m2 = state['count'], state['mean'], state['m2']
+        acc.min, acc.max = state['min'], state['max']
+        acc.origin = None if state['origin'] is None else pd.Timestamp(state['origin'])
+        acc.n_xy, acc.mean_x, acc.mean_y = state['n_xy'], state['mean_x'], state['mean_y']
+        acc.m2_x, acc.c_xy = state['m2_x'], state['c_xy']
+        acc.first, acc.last = point(state['first']), point(state['last'])
+        acc.sketch.count = state['sketch']['count']
+        acc.sketch.min, acc.sketch.max = state['sketch']['min'], state['sketch']['max']
+        acc.sketch.levels = [np.asarray(level, dtype=float) for level in state['sketch']['levels']]
+        return acc
+
+
+# ---------------------------------------------------------------------------
+# Partitioned execution
+#
+# The parallel_* variants below split a large DataFrame, a directory of data
+# files or a list of file paths into partitions, process them on a pool of
+# worker processes and combine the partial results so that the output matches
+# the single-process function on the concatenated data. Passing files lets
+# each worker read its own partition, which is where throughput scales with
+# the number of cores; in-memory frames have to be pickled to the workers.
+# ---------------------------------------------------------------------------
+
+def _read_partition(partition: Union[pd.DataFrame, str],
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Return a partition as a DataFrame, reading it from disk if it is a path."""
+    if isinstance(partition, pd.DataFrame):
+        return partition if columns is None else partition[columns]
+    if partition.endswith('.csv'):
+        return pd.read_csv(partition, usecols=columns)
+    if partition.endswith('.parquet'):
+        return pd.read_parquet(partition, columns=columns)
+    if partition.endswith(('.json', '.jsonl')):
+        df = pd.read_json(partition, lines=partition.endswith('.jsonl'))
+        return df if columns is None else df[columns]
+    raise ValueError(f"Unsupported file format: {partition}")
+
+
+def _make_partitions(source: Union[pd.DataFrame, str, List[str]],
+                     n_partitions: int) -> List[Union[pd.DataFrame, str]]:
+    """Split a DataFrame into row ranges, or list the data files of a directory."""
+    if isinstance(source, pd.DataFrame):
+        bounds = np.linspace(0, len(source), max(1, min(n_partitions, len(source))) + 1, dtype=int)
+        return [source.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    if isinstance(source, str):
+        if not os.path.isdir(source):
+            return [source]
+        return sorted(os.path.join(source, name) for name in os.listdir(source)
+                      if name.endswith(DATA_FILE_EXTENSIONS))
+    return list(source)
+
+
+def _run_partitions(func, partitions: List[Any], n_workers: Optional[int], *args) -> List[Any]:
+    """Apply ``func(partition, *args)`` to every partition on a process pool, preserving order."""
+    if n_workers == 1 or len(partitions) <= 1:
+        return [func(partition, *args) for partition in partitions]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(func, partitions, *[[arg] * len(partitions) for arg in args]))
+
+
+def _dedup_partition(partition: Union[pd.DataFrame, str], drop_nulls: bool) -> pd.DataFrame:
+    df = _read_partition(partition).drop_duplicates()
+    # Dropping null rows commutes with de-duplication, so it can run per partition
+    return df.dropna() if drop_nulls else df
+
+
+def parallel_clean_data(source: Union[pd.DataFrame, str, List[str]],
+                        drop_nulls: bool = True,
+                        fill_value: Optional[Any] = None,
+                        n_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Partitioned version of ``clean_data``.
+    
+    Each worker removes duplicates within its partition (and null rows when
+    ``drop_nulls``); the partial results are then de-duplicated globally before
+    nulls are filled, so the result matches ``clean_data`` on the full data.
+    
+    Args:
+        source: DataFrame, directory of data files, or list of file paths
+        drop_nulls: Whether to drop rows with null values
+        fill_value: Value to fill nulls with (if drop_nulls is False)
+        n_workers: Number of worker processes (defaults to the CPU count)
+    
+    Returns:
+        Cleaned DataFrame
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    partitions = _make_partitions(source, n_workers)
+    parts = _run_partitions(_dedup_partition, partitions, n_workers, drop_nulls)
+    
+    cleaned_df = pd.concat(parts) if parts else pd.DataFrame()
+    cleaned_df = cleaned_df.drop_duplicates()
+    
+    if not drop_nulls and fill_value is not None:
+        cleaned_df = cleaned_df.fillna(fill_value)
+    
+    return cleaned_df
+
+
+def _column_partial(partition: Union[pd.DataFrame, str], column: str,
+                    keep: Optional[str], sketch_size: int) -> Dict[str, Any]:
+    values = _read_partition(partition, [column])[column].to_numpy(dtype=float)
+    partial = _moments(values)
+    if keep == 'values':
+        partial['values'] = values[~np.isnan(values)]
+    elif keep == 'sketch':
+        partial['sketch'] = QuantileSketch(sketch_size).update(values)
+    return partial
+
+
+def _filter_partition(partition: Union[pd.DataFrame, str],
+                      bounds: Dict[str, Tuple[float, float]],
+                      inclusive: bool) -> pd.DataFrame:
+    return apply_outlier_bounds(_read_partition(partition), bounds, inclusive)
+
+
+def parallel_filter_outliers(source: Union[pd.DataFrame, str, List[str]],
+                             column: str,
+                             method: str = 'iqr',
+                             n_workers: Optional[int] = None,
+                             approximate: bool = False,
+                             sketch_size: int = 200) -> pd.DataFrame:
+    """
+    Partitioned version of ``filter_outliers``.
+    
+    A first pass collects the column from every partition to compute global
+    bounds (exact or sketched quartiles for 'iqr', merged mean and standard
+    deviation for 'zscore'); a second pass filters each partition against
+    those bounds.
+    
+    Args:
+        source: DataFrame, directory of data files, or list of file paths
         column: Column name to filter outliers from
         method: Method to use ('iqr' or 'zscore')
+        n_workers: Number of worker processes (defaults to the CPU count)
+        approximate: Merge per-partition QuantileSketches instead of
+            collecting the column values ('iqr' only)
+        sketch_size: Accuracy parameter of the sketch
     
     Returns:
         DataFrame with outliers removed
     """
+    if method not in ('iqr', 'zscore'):
+        raise ValueError("Method must be 'iqr' or 'zscore'")
+    
+    n_workers = n_workers or os.cpu_count() or 1
+    partitions = _make_partitions(source, n_workers)
+    keep = None if method == 'zscore' else ('sketch' if approximate else 'values')
+    partials = _run_partitions(_column_partial, partitions, n_workers, column, keep, sketch_size)
+    
     if method == 'iqr':
-        Q1 = df[column].quantile(0.25)
-        Q3 = df[column].quantile(0.75)
+        if approximate:
+            sketch = QuantileSketch(sketch_size)
+            for partial in partials:
+                sketch.merge(partial['sketch'])
+            Q1, Q3 = sketch.quantile([0.25, 0.75])
+        else:
+            values = np.concatenate([p['values'] for p in partials]) if partials else np.empty(0)
+            Q1, Q3 = np.quantile(values, [0.25, 0.75]) if len(values) else (np.nan, np.nan)
         IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        
-        return df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
+        bounds = {column: (Q1 - 1.5 * IQR, Q3 + 1.5 * IQR)}
+    else:
+        moments = {'count': 0, 'mean': 0.0, 'm2': 0.0}
+        for partial in partials:
+            moments = _merge_moments(moments, partial)
+        std = np.sqrt(moments['m2'] / (moments['count'] - 1)) if moments['count'] > 1 else np.nan
+        # |x - mean| / std < 3  <=>  mean - 3 std < x < mean + 3 std
+        bounds = {column: (moments['mean'] - 3 * std, moments['mean'] + 3 * std)}
+    
+    parts = _run_partitions(_filter_partition, partitions, n_workers, bounds, method == 'iqr')
+    return pd.concat(parts) if parts else pd.DataFrame()
+
+
+def _trend_partial(partition: Union[pd.DataFrame, str], date_column: str,
+                   value_column: str, approximate: bool, sketch_size: int) -> Dict[str, Any]:
+    df = _read_partition(partition, [date_column, value_column])
+    dates = pd.to_datetime(df[date_column])
+    values = df[value_column].to_numpy(dtype=float)
+    partial = _moments(values)
+    if approximate:
+        partial['sketch'] = QuantileSketch(sketch_size).update(values)
+    else:
+        partial['values'] = values[~np.isnan(values)]
+    partial['min'] = np.nanmin(values) if partial['count'] else np.nan
+    partial['max'] = np.nanmax(values) if partial['count'] else np.nan
+    if dates.notna().any():
+        first, last = dates.argmin(), dates.argmax()
+        partial['first'] = (dates.iloc[first], values[first])
+        partial['last'] = (dates.iloc[last], values[last])
+    return partial
+
+
+def parallel_analyze_trends(source: Union[pd.DataFrame, str, List[str]],
+                            date_column: str,
+                            value_column: str,
+                            n_workers: Optional[int] = None,
+                            approximate: bool = False,
+                            sketch_size: int = 200) -> Dict[str, Any]:
+    """
+    Partitioned version of ``analyze_trends``.
     
-    elif method == 'zscore':
-        z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-        return df[z_scores < 3]
+    Workers compute per-partition moments, extremes and the earliest and latest
+    observations; these are merged into global statistics without sorting the
+    full data. The caller's DataFrame is not modified.
     
+    The exact median needs every non-null value, so by default they are sent
+    back to the parent (O(n) memory there). With ``approximate=True`` each
+    worker returns a ``QuantileSketch`` instead and the merged sketch gives
+    the median, keeping the parent's memory independent of the data size.
+    
+    Args:
+        source: DataFrame, directory of data files, or list of file paths
+        date_column: Name of the date column
+        value_column: Name of the value column to analyze
+        n_workers: Number of worker processes (defaults to the CPU count)
+        approximate: Estimate the median from merged quantile sketches
+        sketch_size: Sketch accuracy parameter ``k`` when ``approximate`` is set
+    
+    Returns:
+        Dictionary with trend analysis results
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    partitions = _make_partitions(source, n_workers)
+    partials = _run_partitions(_trend_partial, partitions, n_workers, date_column, value_column,
+                               approximate, sketch_size)
+    
+    moments = {'count': 0, 'mean': 0.0, 'm2': 0.0}
+    for partial in partials:
+        moments = _merge_moments(moments, partial)
+    
+    if approximate:
+        sketch = QuantileSketch(sketch_size)
+        for partial in partials:
+            sketch.merge(partial['sketch'])
+        median = sketch.quantile(0.5)
     else:
-        raise ValueError("Method must be 'iqr' or 'zscore'")
\ No newline at end of file
+        values = np.concatenate([p['values'] for p in partials]) if partials else np.empty(0)
+        median = np.median(values) if len(values) else np.nan
+    firsts = [p['first'] for p in partials if 'first' in p]
+    lasts = [p['last'] for p in partials if 'last' in p]
+    first_value = min(firsts, key=lambda item: item[0])[1] if firsts else np.nan
+    last_value = max(lasts, key=lambda item: item[0])[1] if lasts else np.nan
+    
+    return {
+        'mean': moments['mean'] if moments['count'] else np.nan,
+        'median': median,
+        'std': np.sqrt(moments['m2'] / (moments['count'] - 1)) if moments['count'] > 1 else np.nan,
+        'min': np.nanmin([p['min'] for p in partials]) if moments['count'] else np.nan,
+        'max': np.nanmax([p['max'] for p in partials]) if moments['count'] else np.nan,
+        'trend': 'increasing' if last_value > first_value else 'decreasing'
+    }
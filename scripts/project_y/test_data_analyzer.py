@@ -0,0 +1,115 @@
+"""Behaviour checks for data_analyzer. Run with ``python -m pytest scripts/project_y``."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_analyzer import DataAnalyzer, _ModeSketch
+
+
+def test_profile_data_empty_frame():
+    analyzer = DataAnalyzer(data=pd.DataFrame({'a': pd.Series([], dtype=float), 'b': pd.Series([], dtype=object)}))
+    profile = analyzer.profile_data()
+    assert profile.n_rows == 0
+    assert profile.sample_rows == 0
+    assert list(profile.columns.index) == ['a', 'b']
+
+
+def test_profile_data_filters_matching_nothing(tmp_path):
+    path = tmp_path / 'data.csv'
+    pd.DataFrame({'a': range(10), 'b': ['x'] * 10}).to_csv(path, index=False)
+    profile = DataAnalyzer(str(path), chunksize=4, filters=[('b', '==', 'missing')]).profile_data()
+    assert profile.n_rows == 0
+    assert profile.sample_rows == 0
+
+
+def test_profile_data_column_turning_non_numeric_in_later_chunk(tmp_path):
+    path = tmp_path / 'data.csv'
+    values = [str(i) for i in range(100)] + ['unknown'] * 5
+    pd.DataFrame({'a': values}).to_csv(path, index=False)
+    profile = DataAnalyzer(str(path), chunksize=40).profile_data()
+    assert profile.n_rows == 105
+    assert profile.columns.loc['a', 'mean'] == np.mean(range(100))
+    assert profile.quantiles.loc['a', 0.5] == np.median(range(100))
+
+
+def _messy_frame(n_rows=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'x': rng.normal(size=n_rows).round(2),
+        'n': rng.integers(0, 50, n_rows).astype(float),
+        'city': rng.choice(['Oslo', 'Lima', 'Pune', 'Kiev'], n_rows, p=[0.4, 0.3, 0.2, 0.1]),
+        'sparse': np.where(rng.random(n_rows) < 0.9, np.nan, 1.0),
+    })
+    df.loc[rng.random(n_rows) < 0.1, 'x'] = np.nan
+    df.loc[rng.random(n_rows) < 0.1, 'city'] = None
+    return pd.concat([df, df.iloc[:300]], ignore_index=True)
+
+
+def test_mode_sketch_matches_series_mode():
+    rng = np.random.default_rng(1)
+    values = pd.Series(np.concatenate([rng.integers(0, 10_000, 50_000).astype(str), np.full(2_000, 'top')]))
+    values = values.sample(frac=1, random_state=0)
+    sketch = _ModeSketch(capacity=100)
+    for start in range(0, len(values), 5_000):
+        sketch.update(values.iloc[start:start + 5_000])
+    assert sketch.mode() == values.mode().iloc[0]
+    assert len(sketch.counts) <= 100
+
+
+def test_mode_sketch_exact_when_capacity_covers_all_values():
+    values = pd.Series(list('abcabcaab'))
+    sketch = _ModeSketch(capacity=10)
+    sketch.update(values.iloc[:4])
+    sketch.update(values.iloc[4:])
+    assert sketch.mode() == values.mode().iloc[0]
+    assert _ModeSketch().mode() is None
+
+
+def test_clean_data_drops_sparse_columns_and_imputes_each_column():
+    df = _messy_frame()
+    # Every value distinct, so its mode is a long tie list that must not leak into other columns
+    df['ids'] = [f"id_{i}" for i in range(len(df))]
+    df.loc[df.index[::7], 'ids'] = None
+    deduped = df.drop_duplicates()
+    analyzer = DataAnalyzer(data=df)
+    analyzer.clean_data()
+    cleaned = analyzer.df
+    assert 'sparse' not in cleaned.columns
+    assert len(cleaned) == len(deduped)
+    assert not cleaned.isnull().any().any()
+    assert cleaned.loc[deduped['x'].isna(), 'x'].eq(deduped['x'].median()).all()
+    assert cleaned.loc[deduped['city'].isna(), 'city'].eq(deduped['city'].mode().iloc[0]).all()
+    assert cleaned.loc[deduped['ids'].isna(), 'ids'].eq(deduped['ids'].mode().iloc[0]).all()
+
+def test_streaming_clean_matches_in_memory_clean(tmp_path):
+    path = tmp_path / 'messy.csv'
+    _messy_frame().to_csv(path, index=False)
+
+    loaded = DataAnalyzer(str(path))
+    loaded.clean_data()
+    output_path = tmp_path / 'clean.csv'
+    DataAnalyzer(str(path), chunksize=250).clean_data(output_path=str(output_path))
+    streamed = pd.read_csv(output_path)
+
+    pd.testing.assert_frame_equal(streamed, loaded.df.reset_index(drop=True), check_dtype=False)
+
+
+def test_iter_chunks_applies_columns_and_filters_to_loaded_frame():
+    df = pd.DataFrame({'a': range(10), 'b': list('xyxyxyxyxy')})
+    analyzer = DataAnalyzer(data=df)
+    chunks = list(analyzer.iter_chunks(chunksize=3, columns=['a'], filters=[('b', '==', 'x')]))
+    result = pd.concat(chunks)
+    assert list(result.columns) == ['a']
+    assert result['a'].tolist() == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.parametrize('target_dtype', ['category', 'str', object])
+def test_build_model_treats_label_targets_as_classification(target_dtype):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=600)
+    labels = np.array([f"class_{i}" for i in range(12)])[np.digitize(x, np.linspace(-2, 2, 11))]
+    analyzer = DataAnalyzer(data=pd.DataFrame({'x': x, 'label': pd.Series(labels).astype(target_dtype)}))
+    analyzer.build_model('label')
+    assert analyzer.models['label']['is_classification']
+    assert set(analyzer.predict('label', pd.DataFrame({'x': [0.0, 1.5]}))) <= set(labels)
@@ -0,0 +1,123 @@
+"""Behaviour checks for arcgis_utils. Run with ``python -m pytest scripts/test_arcgis_utils.py``."""
+
+import asyncio
+import io
+import logging
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from arcgis_utils import (ArcGISConnectionManager, ArcGISUtils, AsyncArcGISUtils, HTTPSessionPool,
+                          _BatchingQueueListener)
+
+
+@pytest.fixture
+def busy_server():
+    """Local HTTP server that answers every GET with 503 and counts the requests."""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_pool_returns_last_response_after_status_retries(busy_server):
+    url, requests_seen = busy_server
+    pool = HTTPSessionPool(retries=2, backoff_factor=0)
+    try:
+        response = pool.get(f"{url}/portal", timeout=5)
+    finally:
+        pool.close()
+    assert response.status_code == 503
+    assert len(requests_seen) == 3
+
+
+def test_session_pool_reuses_session_per_host(busy_server):
+    url, _ = busy_server
+    pool = HTTPSessionPool(retries=0)
+    try:
+        assert pool.get_session(f"{url}/a") is pool.get_session(f"{url}/b")
+        assert pool.stats()["hits"] == 1
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize("message", [
+    "Invalid username or password.\n(Error Code: 400)",
+    "Token Required (Error Code: 499)",
+    "401 Client Error: Unauthorized for url: https://portal/sharing/rest",
+])
+def test_auth_errors_are_recognised(message):
+    assert ArcGISConnectionManager._is_auth_error(message)
+
+
+@pytest.mark.parametrize("message", [
+    "HTTPSConnectionPool(host='portal', port=4010): Read timed out",
+    "Item 4019a2c1 not found",
+    "Expected 401 rows, got 400",
+])
+def test_unrelated_numbers_are_not_auth_errors(message):
+    assert not ArcGISConnectionManager._is_auth_error(message)
+
+
+def test_batching_listener_applies_filters_and_supports_any_handler():
+    class SkipFilter(logging.Filter):
+        def filter(self, record):
+            return "skip" not in record.getMessage()
+
+    class ListHandler(logging.Handler):
+        """Handler without a stream, like SMTP or HTTP handlers."""
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    stream = io.StringIO()
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.addFilter(SkipFilter())
+    list_handler = ListHandler()
+    log_queue = queue.Queue()
+    listener = _BatchingQueueListener(log_queue, [stream_handler, list_handler], batch_size=4)
+    logger = logging.getLogger("test_batching_listener")
+    for i in range(10):
+        message = f"message {i} skip" if i % 5 == 0 else f"message {i}"
+        log_queue.put(logger.makeRecord(logger.name, logging.INFO, __file__, 0, message, (), None))
+    listener.stop()
+
+    assert stream.getvalue().count("\n") == 8
+    assert len(list_handler.messages) == 10
+
+
+def test_async_certificate_check_matches_sync(busy_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url, _ = busy_server
+    # The local server speaks plain HTTP, so the HTTPS probe fails on both paths
+    utils = ArcGISUtils(log_level="CRITICAL")
+
+    async def check():
+        async with AsyncArcGISUtils(utils) as async_utils:
+            return await async_utils.verify_certificate(url, timeout=2)
+
+    try:
+        sync_result = utils.verify_certificate(url)
+        assert sync_result is None
+        assert asyncio.run(check()) == sync_result
+    finally:
+        utils.close()